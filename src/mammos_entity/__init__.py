@@ -13,6 +13,7 @@ magnetic entities (such as :py:class:`~mammos_entity.Ms`, :py:class:`~mammos_ent
 """
 
 import importlib.metadata
+from typing import TYPE_CHECKING
 
 from mammos_entity._entity import Entity
 from mammos_entity._entity_collection import EntityCollection
@@ -33,11 +34,14 @@ from mammos_entity._factory import (
     T,
     Tc,
 )
-from mammos_entity._ontology import mammos_ontology, search_labels
+from mammos_entity._ontology import search_labels
 from mammos_entity._read_files import from_csv, from_hdf5, from_yaml
 
 from . import operations
 
+if TYPE_CHECKING:
+    from mammos_entity._ontology import mammos_ontology
+
 __version__ = importlib.metadata.version(__package__)
 
 
@@ -67,3 +71,17 @@ __all__ = [
     "from_hdf5",
     "from_yaml",
 ]
+
+
+def __getattr__(name: str):
+    # ``mammos_ontology`` is loaded lazily by the ``_ontology`` module (PEP 562).
+    if name == "mammos_ontology":
+        from mammos_entity import _ontology
+
+        return _ontology.mammos_ontology
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    # list the lazily loaded ``mammos_ontology`` for tab completion
+    return sorted([*globals(), "mammos_ontology"])
@@ -7,6 +7,8 @@ includes helper functions for inferring the correct SI units from the ontology.
 
 from __future__ import annotations
 
+import math
+import numbers
 import os
 import re
 from functools import cache
@@ -14,10 +16,11 @@ from typing import TYPE_CHECKING
 
 import h5py
 import mammos_units as u
+import numpy as np
 
 import mammos_entity as me
 from mammos_entity import _entity_collection_tree as _tree_repr
-from mammos_entity._ontology import mammos_ontology, search_labels
+from mammos_entity._ontology import search_labels
 
 if TYPE_CHECKING:
     import astropy.units
@@ -31,6 +34,53 @@ if TYPE_CHECKING:
 base_units = [u.T, u.J, u.m, u.A, u.radian, u.kg, u.s, u.K, u.mol, u.cd, u.V]
 mammos_equivalencies = u.temperature()
 
+# unit registry active on import, parsed unit strings are only cached for this registry
+_DEFAULT_UNIT_REGISTRY = u.get_current_unit_registry()
+
+# Units allowed by the ontology for the entities created by the factory functions in
+# ``_factory.py``. They are used instead of traversing the ontology, so that creating
+# these entities does not require loading the ontology. The test suite checks that
+# they agree with the units derived from the ontology.
+_BUILTIN_ONTOLOGY_UNITS = {
+    "CoercivityHcExternal": ("A / m",),
+    "CurieTemperature": ("K", "deg_C"),
+    "ExchangeStiffnessConstant": ("J / m",),
+    "ExternalMagneticField": ("A / m",),
+    "MagneticFluxDensity": ("T",),
+    "MagneticPolarisation": ("T",),
+    "MagnetocrystallineAnisotropyConstantK1": ("J / m3",),
+    "MagnetocrystallineAnisotropyConstantK2": ("J / m3",),
+    "Magnetization": ("A / m",),
+    "MaximumEnergyProduct": ("J / m3",),
+    "Remanence": ("A / m",),
+    "SpontaneousMagneticPolarization": ("T",),
+    "SpontaneousMagnetization": ("A / m",),
+    "ThermodynamicTemperature": ("K", "deg_C"),
+    "UniaxialAnisotropyConstant": ("J / m3",),
+}
+
+# IRIs of the ontology entries in ``_BUILTIN_ONTOLOGY_UNITS``, used to write these
+# entities to files without loading the ontology.
+_BUILTIN_ONTOLOGY_IRIS = {
+    "CoercivityHcExternal": "https://w3id.org/emmo/domain/magnetic-materials#EMMO_fe101d1d-f1f7-54f8-886b-fa6d6052ce98",
+    "CurieTemperature": "https://w3id.org/emmo#EMMO_6b5af5a8_a2d8_4353_a1d6_54c9f778343d",
+    "ExchangeStiffnessConstant": "https://w3id.org/emmo/domain/magnetic-materials#EMMO_526ed2a5-a017-590e-8eb8-8a900f2b3b78",
+    "ExternalMagneticField": "https://w3id.org/emmo/domain/magnetic-materials#EMMO_da08f0d3-fe19-58bc-8fb6-ecc8992d5eb3",
+    "MagneticFluxDensity": "https://w3id.org/emmo#EMMO_961d1aba_f75e_4411_aaa4_457f7516ed6b",
+    "MagneticPolarisation": "https://w3id.org/emmo#EMMO_74a096dd_cc83_4c7e_b704_0541620ff18d",
+    "MagnetocrystallineAnisotropyConstantK1": "https://w3id.org/emmo/domain/magnetic-materials#EMMO_2bb87117-30f9-5b3a-b406-731836a3902f",
+    "MagnetocrystallineAnisotropyConstantK2": "https://w3id.org/emmo/domain/magnetic-materials#EMMO_675fa9ea-408a-51f6-a001-2e6715568a71",
+    "Magnetization": "https://w3id.org/emmo#EMMO_b23e7251_a488_4732_8268_027ad76d7e37",
+    "MaximumEnergyProduct": "https://w3id.org/emmo/domain/magnetic-materials#EMMO_e1028129-c23e-57ac-9174-2f34ddbf3926",
+    "Remanence": "https://w3id.org/emmo/domain/magnetic-materials#EMMO_8fc78216-4859-53c2-b41e-e38062b04054",
+    "SpontaneousMagneticPolarization": "https://w3id.org/emmo/domain/magnetic-materials#EMMO_db6f7b13-1f1d-584f-9d73-47939b86a7cd",
+    "SpontaneousMagnetization": "https://w3id.org/emmo/domain/magnetic-materials#EMMO_032731f8-874d-5efb-9c9d-6dafaa17ef25",
+    "ThermodynamicTemperature": "https://w3id.org/emmo#EMMO_affe07e4_e9bc_4852_86c6_69e26182a17f",
+    "UniaxialAnisotropyConstant": "https://w3id.org/emmo/domain/magnetic-materials#EMMO_49a882d1-9ce7-522b-91e7-3a460f25f5ac",
+}
+
+_CAMEL_SPLIT_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
 
 @cache
 def _convert_unit(
@@ -114,6 +164,31 @@ def _convert_dimension_string(unit_string: str) -> astropy.units.UnitBase:
 def _get_all_possible_units(ontology_label: str) -> tuple[astropy.units.UnitBase]:
     """Get list of accepted units given an ontology label found in the ontology.
 
+    The units of the entities created by the factory functions are taken from
+    ``_BUILTIN_ONTOLOGY_UNITS``, all other units are found in the ontology with
+    :py:func:`_find_all_possible_units`.
+
+    Args:
+        ontology_label: The label of an ontology concept
+            (e.g., 'SpontaneousMagnetization').
+
+    Returns:
+        A list of all compatible astropy units.
+
+    Examples:
+        >>> import mammos_entity as me
+        >>> me._entity._get_all_possible_units("ThermodynamicTemperature")
+        (Unit("K"), Unit("deg_C"))
+
+    """
+    if ontology_label in _BUILTIN_ONTOLOGY_UNITS:
+        return tuple(u.Unit(unit) for unit in _BUILTIN_ONTOLOGY_UNITS[ontology_label])
+    return _find_all_possible_units(ontology_label)
+
+
+def _find_all_possible_units(ontology_label: str) -> tuple[astropy.units.UnitBase]:
+    """Find list of accepted units given an ontology label by traversing the ontology.
+
     Given a label for an ontology entry, this function finds all SI base units,
     SI-coherent units, and some selected special units (classified as
     `SISpecialUnit` in the EMMO ontology), navigating the class hierarchy.
@@ -132,52 +207,51 @@ def _get_all_possible_units(ontology_label: str) -> tuple[astropy.units.UnitBase
 
     Examples:
         >>> import mammos_entity as me
-        >>> me._entity._get_all_possible_units("ThermodynamicTemperature")
-        (Unit("K"), Unit("deg_C"))
+        >>> me._entity._find_all_possible_units("DemagnetizingFactor")
+        (Unit(dimensionless),)
 
     """
     thing = me.mammos_ontology[ontology_label]
+    # attribute access on the ontology performs a label search, so we look up the
+    # ontology classes only once
+    dimensionless_unit = me.mammos_ontology.DimensionlessUnit
+    # We extract only SI base units, coherent units and special units.
+    # See https://emmo-repo.github.io/emmo.html#siunit
+    si_unit_classes = (
+        me.mammos_ontology.SIBaseUnit,
+        me.mammos_ontology.SICoherentDerivedUnit,
+        me.mammos_ontology.SISpecialUnit,
+    )
     possible_units = []
     for ancestor in thing.ancestors():
-        # we find the ancestor with the attribute `hasMeasurementUnit`
-        if hasattr(ancestor, "hasMeasurementUnit") and ancestor.hasMeasurementUnit:
-            measurement_unit = ancestor.hasMeasurementUnit[0]
-            if (
-                measurement_unit == mammos_ontology.DimensionlessUnit
-                or mammos_ontology.DimensionlessUnit in measurement_unit.ancestors()
-            ):
+        # we find the ancestor with the attribute `hasMeasurementUnit`; accessing the
+        # property is expensive, so we only do it once per ancestor
+        if measurement_units := getattr(ancestor, "hasMeasurementUnit", None):
+            measurement_unit = measurement_units[0]
+            if measurement_unit == dimensionless_unit or dimensionless_unit in measurement_unit.ancestors():
                 # entity is dimensionless by ontology
-                possible_units.append(u.Unit(""))
-            elif all_sub_classes := list(ancestor.hasMeasurementUnit[0].subclasses()):
+                possible_units.append(u.dimensionless_unscaled)
+            elif all_sub_classes := list(measurement_unit.subclasses()):
                 for sub_class in all_sub_classes:
-                    # We extract only SI base units, coherent units and special units.
-                    # See https://emmo-repo.github.io/emmo.html#siunit
-                    if isinstance(
-                        sub_class,
-                        (
-                            mammos_ontology.SIBaseUnit,
-                            mammos_ontology.SICoherentDerivedUnit,
-                            mammos_ontology.SISpecialUnit,
-                        ),
-                    ):
+                    if isinstance(sub_class, si_unit_classes):
                         converted_unit = _convert_unit(sub_class)
                         if converted_unit is not None:
                             possible_units.append(converted_unit)
                 if len(possible_units) == 0:
                     # Possible case: the abstract unit only points to non-SI
                     # concrete units. We use Astropy to read the dimension string.
-                    possible_units.append(_convert_dimension_string(ancestor.hasMeasurementUnit[0].hasDimensionString))
+                    possible_units.append(_convert_dimension_string(measurement_unit.hasDimensionString))
             else:
                 # Extreme case: the ancestor has the attribute `hasMeasurementUnit` (the
                 # abstract unit), but it defines to subclasses (the concrete units).
                 # In this case, we create a Astropy unit directly from the dimension
                 # string.
-                possible_units.append(_convert_dimension_string(ancestor.hasMeasurementUnit[0].hasDimensionString))
+                possible_units.append(_convert_dimension_string(measurement_unit.hasDimensionString))
             break
     else:
         # The only alternative is that the ontology concept is not related
         # to a quantifiable physical entity. So its unit is dimensionless.
-        possible_units.append(u.Unit(""))
+        possible_units.append(u.dimensionless_unscaled)
     return tuple(sorted(possible_units, key=str))  # return sorted to guarantee reproducibility
 
 
@@ -207,8 +281,8 @@ def _get_preferred_unit(
         Unit("K")
 
     """  # noqa:E501
-    if u.Unit("K") in possible_units:
-        return u.Unit("K")
+    if u.K in possible_units:
+        return u.K
     if len(possible_units) == 1:
         return possible_units[0]
     rescaled_units = []
@@ -224,6 +298,69 @@ def _get_preferred_unit(
     return out
 
 
+def _parse_unit(unit_string: str) -> astropy.units.UnitBase:
+    """Create an astropy unit from a string.
+
+    Parsing unit strings with astropy is slow, so units given as strings are only
+    parsed once. The result of parsing depends on the units and aliases enabled in
+    astropy's current unit registry. Results are therefore only cached while the
+    registry that was active when mammos_entity was imported is in use; inside
+    contexts such as ``u.add_enabled_units(...)`` or ``u.set_enabled_aliases(...)``
+    the string is parsed on every call.
+
+    Args:
+        unit_string: String representation of the unit.
+
+    Returns:
+        Astropy unit.
+
+    Examples:
+        >>> import mammos_entity as me
+        >>> me._entity._parse_unit("kA/m")
+        Unit("kA / m")
+
+    """
+    if u.get_current_unit_registry() is _DEFAULT_UNIT_REGISTRY:
+        return _parse_unit_default_registry(unit_string)
+    return u.Unit(unit_string)
+
+
+@cache
+def _parse_unit_default_registry(unit_string: str) -> astropy.units.UnitBase:
+    """Create an astropy unit from a string using the default unit registry."""
+    return u.Unit(unit_string)
+
+
+@cache
+def _is_compatible_unit(
+    unit: astropy.units.UnitBase,
+    possible_units: tuple[astropy.units.UnitBase],
+) -> bool:
+    """Check if a unit is compatible with the units allowed by the ontology.
+
+    Only the equivalencies defined in ``mammos_equivalencies`` are taken into account,
+    equivalencies enabled by the user are ignored.
+
+    Args:
+        unit: Astropy unit to check.
+        possible_units: Astropy units compatible with the ontology.
+
+    Returns:
+        True if the unit is equivalent to at least one of the possible units.
+
+    Examples:
+        >>> import mammos_entity as me
+        >>> import mammos_units as u
+        >>> me._entity._is_compatible_unit(u.Unit("deg_C"), (u.Unit("K"),))
+        True
+        >>> me._entity._is_compatible_unit(u.Unit("T"), (u.Unit("A / m"),))
+        False
+
+    """
+    with u.set_enabled_equivalencies(mammos_equivalencies):
+        return any(unit.is_equivalent(possible_unit) for possible_unit in possible_units)
+
+
 @cache
 def _select_ontology_label(label: str) -> str:
     """Select ontology label from given one.
@@ -247,8 +384,12 @@ def _select_ontology_label(label: str) -> str:
             is ambiguous as an alternative label.
 
     """
+    if label in _BUILTIN_ONTOLOGY_UNITS:
+        # labels used by the factory functions are known prefLabels
+        return label
+
     # Find prefLabel
-    prefLabel_matches = mammos_ontology.search(prefLabel=label)
+    prefLabel_matches = me.mammos_ontology.search(prefLabel=label)
     n_matches = len(prefLabel_matches)
     if n_matches == 1:
         return str(prefLabel_matches[0].prefLabel[0])
@@ -275,6 +416,108 @@ def _select_ontology_label(label: str) -> str:
         )
 
 
+@cache
+def _get_ontology_class(ontology_label: str) -> owlready2.entity.ThingClass:
+    """Get the ontology class with the given label.
+
+    Args:
+        ontology_label: The label of an ontology concept
+            (e.g., 'SpontaneousMagnetization').
+
+    Returns:
+        The ontology class.
+
+    Examples:
+        >>> import mammos_entity as me
+        >>> me._entity._get_ontology_class("SpontaneousMagnetization")
+        magnetic-materials.SpontaneousMagnetization
+
+    """
+    return me.mammos_ontology.get_by_label(ontology_label)
+
+
+@cache
+def _get_ontology_iri(ontology_label: str) -> str:
+    """Get the IRI of the ontology class with the given label.
+
+    The IRIs of the entities created by the factory functions are taken from
+    ``_BUILTIN_ONTOLOGY_IRIS``, all other IRIs are read from the ontology.
+
+    Args:
+        ontology_label: The label of an ontology concept
+            (e.g., 'SpontaneousMagnetization').
+
+    Returns:
+        The IRI of the ontology class.
+
+    Examples:
+        >>> import mammos_entity as me
+        >>> me._entity._get_ontology_iri("AngularVelocity")
+        'https://w3id.org/emmo#EMMO_bd325ef5_4127_420c_83d3_207b3e2184fd'
+
+    """
+    if ontology_label in _BUILTIN_ONTOLOGY_IRIS:
+        return _BUILTIN_ONTOLOGY_IRIS[ontology_label]
+    return _get_ontology_class(ontology_label).iri
+
+
+def _isclose(a: float, b: float) -> bool:
+    """Check if two floats are close to each other.
+
+    This is a fast scalar version of ``u.allclose(a, b, equal_nan=True)`` for values
+    with the same unit, i.e. it uses a relative tolerance of ``1e-5`` with respect to
+    ``b`` and no absolute tolerance. Two NaN values are considered close.
+
+    Args:
+        a: First value.
+        b: Second value.
+
+    Returns:
+        True if the values are close.
+
+    Examples:
+        >>> import mammos_entity as me
+        >>> me._entity._isclose(1.0, 1.000001)
+        True
+        >>> me._entity._isclose(float("nan"), float("nan"))
+        True
+        >>> me._entity._isclose(1.0, float("inf"))
+        False
+
+    """
+    if a == b:
+        return True
+    if math.isnan(a) or math.isnan(b):
+        return math.isnan(a) and math.isnan(b)
+    if math.isinf(a) or math.isinf(b):
+        return False
+    return abs(a - b) <= 1e-5 * abs(b)
+
+
+@cache
+def _axis_label(ontology_label: str, unit: astropy.units.UnitBase) -> str:
+    """Create an axis label from an ontology label and a unit.
+
+    Args:
+        ontology_label: Ontology label, split with spaces at all capital letters.
+        unit: Astropy unit, added in parentheses unless it is dimensionless.
+
+    Returns:
+        Axis label for plots.
+
+    Examples:
+        >>> import mammos_entity as me
+        >>> import mammos_units as u
+        >>> me._entity._axis_label("SpontaneousMagnetization", u.Unit("A / m"))
+        'Spontaneous Magnetization (A / m)'
+        >>> me._entity._axis_label("DemagnetizingFactor", u.dimensionless_unscaled)
+        'Demagnetizing Factor'
+
+    """
+    unit_string = str(unit)
+    return _CAMEL_SPLIT_RE.sub(" ", ontology_label) + (f" ({unit_string})" if unit_string else "")
+
+
 class Entity:
     """Create a quantity (a value and a unit) linked to the EMMO ontology.
 
@@ -286,6 +529,8 @@ class Entity:
         value: Value
         unit: Unit
         description: Description
+        copy: If False, the data of ``value`` is only copied if required (e.g. for a
+            unit conversion) and the entity can share memory with ``value``.
 
     Examples:
         >>> import mammos_entity as me
@@ -298,6 +543,8 @@ class Entity:
 
     """  # noqa: E501
 
+    __slots__ = ("__weakref__", "_description", "_ontology_label", "_quantity")
+
     def __init__(
         self,
         ontology_label: str,
@@ -305,6 +552,7 @@ class Entity:
         unit: str | None | mammos_units.UnitBase = None,
         *,
         description: str = "",
+        copy: bool = True,
     ):
         self.description = description
         if isinstance(value, Entity):
@@ -322,19 +570,41 @@ class Entity:
         # Get ontology-compatible units
         ontology_units = _get_all_possible_units(label)
 
-        if unit is None:
-            unit = value.unit if isinstance(value, u.Quantity) else _get_preferred_unit(ontology_units)
+        if unit is None and not isinstance(value, u.Quantity):
+            # The preferred unit is chosen from the ontology units, so it is compatible
+            # by construction and does not need to be checked.
+            unit = _get_preferred_unit(ontology_units)
         else:
-            unit = u.Unit(unit)
-
-        with u.set_enabled_equivalencies(mammos_equivalencies):
-            if not any(unit.is_equivalent(ou) for ou in ontology_units):
+            if unit is None:
+                unit = value.unit
+            elif isinstance(unit, str):
+                unit = _parse_unit(unit)
+            else:
+                unit = u.Unit(unit)
+            if not _is_compatible_unit(unit, ontology_units):
                 raise ValueError(
                     f"Given unit: {unit} incompatible with ontology. "
                     f"Allowed units for entity {label} are: {ontology_units}."
                 )
 
-            self._quantity = u.Quantity(value=value, unit=unit)
+        if isinstance(value, u.Quantity) and value.unit is not unit:
+            # Converting quantities can require the mammos equivalencies.
+            with u.set_enabled_equivalencies(mammos_equivalencies):
+                self._quantity = u.Quantity(value.to(unit, copy=copy), copy=None)
+        elif (
+            isinstance(value, u.Quantity | numbers.Number)
+            or isinstance(value, np.ndarray)
+            and value.dtype.kind in "biufc"
+        ):
+            # Plain numbers and numeric arrays carry no unit (or already the target
+            # unit), so no conversion and no equivalencies are required.
+            # copy=None only copies the data if required
+            self._quantity = u.Quantity(value=value, unit=unit, copy=True if copy else None)
+        else:
+            # All other inputs (e.g. sequences, strings or object arrays) can contain
+            # quantities, which can require the mammos equivalencies.
+            with u.set_enabled_equivalencies(mammos_equivalencies):
+                self._quantity = u.Quantity(value=value, unit=unit, copy=True if copy else None)
         self._ontology_label = label
 
     @property
@@ -381,7 +651,7 @@ class Entity:
             The ontology IRI corresponding to the right ontology record.
 
         """
-        return self.ontology.iri
+        return _get_ontology_iri(self.ontology_label)
 
     @property
     def ontology_label_with_iri(self) -> str:
@@ -407,7 +677,7 @@ class Entity:
             The ontology object matching the entity.
 
         """
-        return mammos_ontology.get_by_label(self.ontology_label)
+        return _get_ontology_class(self.ontology_label)
 
     @property
     def quantity(self) -> mammos_units.Quantity:
@@ -506,7 +776,7 @@ class Entity:
             >>> me.Entity("DemagnetizingFactor").axis_label
             'Demagnetizing Factor'
         """
-        return re.sub(r"(?<!^)(?=[A-Z])", " ", f"{self.ontology_label}") + (f" ({self.unit})" if str(self.unit) else "")
+        return _axis_label(self.ontology_label, self.unit)
 
     def __eq__(self, other: mammos_entity.Entity) -> bool:
         """Check if two Entities are identical.
@@ -526,19 +796,40 @@ class Entity:
             >>> ms_1 == t
             False
         """
+        if self is other:
+            return True
         if not isinstance(other, self.__class__):
             return NotImplemented
-        with u.set_enabled_equivalencies(mammos_equivalencies):
-            return (
-                self.ontology_label == other.ontology_label
-                and self.q.shape == other.q.shape
-                and u.allclose(self.q, other.q, equal_nan=True)
+        if self.ontology_label != other.ontology_label:
+            return False
+        if self.unit is other.unit or self.unit == other.unit:
+            # Values with the same unit are compared without the (slow) unit handling
+            # of u.allclose, using the same tolerances.
+            value, other_value = self._quantity.value, other._quantity.value
+            if isinstance(value, float) and isinstance(other_value, float):
+                return _isclose(value, other_value)
+            return np.shape(value) == np.shape(other_value) and np.allclose(
+                value, other_value, rtol=1e-5, atol=0, equal_nan=True
             )
+        with u.set_enabled_equivalencies(mammos_equivalencies):
+            return self.q.shape == other.q.shape and u.allclose(self.q, other.q, equal_nan=True)
+
+    def __getstate__(self):
+        """Return the state for pickling.
+
+        Defined explicitly because instances have no ``__dict__``, which is required
+        for pickle protocols 0 and 1.
+        """
+        return self._ontology_label, self._quantity, self._description
+
+    def __setstate__(self, state):
+        """Restore the state created by :py:meth:`__getstate__`."""
+        self._ontology_label, self._quantity, self._description = state
 
     def __repr__(self) -> str:
         args = [f"ontology_label='{self._ontology_label}'", f"value={self.value!r}"]
-        if str(self.unit):
-            args.append(f"unit='{self.unit!s}'")
+        if unit_string := str(self.unit):
+            args.append(f"unit='{unit_string}'")
         if self.description:
             args.append(f"description={self.description!r}")
 
@@ -615,7 +906,7 @@ class Entity:
 
         dset = base.create_dataset(name, data=self.value)
         dset.attrs["ontology_label"] = self.ontology_label
-        dset.attrs["ontology_iri"] = self.ontology.iri
+        dset.attrs["ontology_iri"] = self.ontology_iri
         dset.attrs["unit"] = str(self.unit)
         dset.attrs["description"] = self.description
 
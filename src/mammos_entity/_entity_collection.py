@@ -6,6 +6,7 @@ import copy
 import csv
 import os
 import textwrap
+from functools import cache
 from typing import TYPE_CHECKING
 
 import h5py
@@ -28,6 +29,31 @@ if TYPE_CHECKING:
     import mammos_entity.typing
 
 
+# immutable types that do not need to be copied in a deep copy
+_ATOMIC_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes})
+
+# use the libyaml-based dumper if PyYAML has been built with it, it produces identical
+# output and is considerably faster than the pure-Python implementation
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@cache
+def _class_attribute_names(cls: type) -> frozenset[str]:
+    """Return the names of all attributes that can be accessed on a class.
+
+    This includes inherited attributes and attributes of the metaclass, i.e. all names
+    for which ``hasattr(cls, name)`` is true.
+
+    Examples:
+        >>> import mammos_entity as me
+        >>> names = me._entity_collection._class_attribute_names(me.EntityCollection)
+        >>> "to_dataframe" in names, "description" in names, "Ms" in names
+        (True, True, False)
+
+    """
+    return frozenset(dir(cls)) | frozenset(dir(type(cls)))
+
+
 class EntityCollection:
     """Container class storing entity-like objects.
 
@@ -108,6 +134,11 @@ class EntityCollection:
 
     """  # noqa: E501
 
+    # "__dict__" is only allocated when it is first used: when a method of the
+    # collection is overwritten or a private attribute is assigned (see __setattr__),
+    # and when the collection is pickled (see __getstate__).
+    __slots__ = ("__dict__", "__weakref__", "_description", "_entities")
+
     def __init__(
         self,
         description: str = "",
@@ -120,7 +151,7 @@ class EntityCollection:
             **kwargs : entities to be stored in the collection.
         """
         self.description = description
-        self._entities = kwargs
+        object.__setattr__(self, "_entities", kwargs)
 
     def __getitem__(self, key: str) -> mammos_entity.Entity | mammos_units.Quantity | numpy.typing.ArrayLike:
         return self._entities[key]
@@ -163,7 +194,7 @@ class EntityCollection:
         called/the method is overwritten. In such cases add the entity via the dict
         interface ``collection.entities["name"] = value``.
         """
-        if name.startswith("_") or hasattr(self.__class__, name):
+        if name.startswith("_") or name in _class_attribute_names(self.__class__):
             object.__setattr__(self, name, value)
         else:
             self[name] = value
@@ -177,8 +208,13 @@ class EntityCollection:
         If a property/method with the same name exists it gets precedence. In such cases
         access to the entity is only possible via the ``entities`` dictionary.
         """
+        # Private names are never entities. Rejecting them early avoids the dictionary
+        # lookup for attribute probes of other libraries (e.g. ``__array__``) and
+        # recursion if ``_entities`` is not yet set (e.g. during unpickling).
+        if name.startswith("_"):
+            raise AttributeError(name)
         try:
-            return self[name]
+            return self._entities[name]
         except KeyError:
             raise AttributeError(name) from None
 
@@ -190,7 +226,7 @@ class EntityCollection:
         name exists, it gets precedence. In such cases delete from the ``entities``
         dictionary directly by using ``del collection.entities[name]``.
         """
-        if name.startswith("_") or hasattr(self.__class__, name):
+        if name.startswith("_") or name in _class_attribute_names(self.__class__):
             object.__delattr__(self, name)
         elif name in self:
             del self[name]
@@ -202,6 +238,17 @@ class EntityCollection:
         dir.extend(self._entities)
         return sorted(dir)
 
+    def __getstate__(self):
+        """Return the state for pickling without going through attribute access."""
+        return self._description, self._entities, self.__dict__
+
+    def __setstate__(self, state):
+        """Restore the state created by :py:meth:`__getstate__`."""
+        description, entities, attributes = state
+        object.__setattr__(self, "_description", description)
+        object.__setattr__(self, "_entities", entities)
+        self.__dict__.update(attributes)
+
     def __copy__(self):
         """Shallow copy of entities."""
         collection = self.__class__(description=self.description)
@@ -212,9 +259,11 @@ class EntityCollection:
     def __deepcopy__(self, memo):
         """Deep copy of entities."""
         collection = self.__class__(description=self.description)
-        for name, entity_like in self:
-            collection[name] = copy.deepcopy(entity_like, memo)
-
+        # register the copy before copying the entities to support self-references
+        memo[id(self)] = collection
+        entities = collection._entities
+        for name, entity_like in self._entities.items():
+            entities[name] = entity_like if type(entity_like) in _ATOMIC_TYPES else copy.deepcopy(entity_like, memo)
         return collection
 
     @property
@@ -260,27 +309,15 @@ class EntityCollection:
         Args:
             include_units: If true, include units in the dataframe column names.
         """
-        if any(isinstance(element, EntityCollection) for _name, element in self):
-            raise ValueError("Nested collections cannot be converted to dataframe.")
-
-        def unit(key: str) -> str:
-            """Get unit for element key.
-
-            Returns:
-                A string " (unit)" if the element has a unit, otherwise an empty string.
-            """
-            unit = getattr(self[key], "unit", None)
-            if unit and str(unit):
-                return f" ({unit!s})"
-            else:
-                return ""
-
-        return pd.DataFrame(
-            {
-                f"{key}{unit(key) if include_units else ''}": np.atleast_1d(getattr(val, "value", val))
-                for key, val in self
-            }
-        )
+        columns = {}
+        for key, val in self._entities.items():
+            if isinstance(val, EntityCollection):
+                raise ValueError("Nested collections cannot be converted to dataframe.")
+            # add " (unit)" to the column name if the element has a unit
+            if include_units and (unit := getattr(val, "unit", None)) and (unit_string := str(unit)):
+                key = f"{key} ({unit_string})"
+            columns[key] = np.atleast_1d(getattr(val, "value", val))
+        return pd.DataFrame(columns)
 
     def metadata(self) -> dict[str, dict[str, str]]:
         """Get entity metadata as dictionary.
@@ -307,13 +344,16 @@ class EntityCollection:
         """  # noqa: E501
         result = {}
         for name, entity_like in self._entities.items():
-            element = {}
             if isinstance(entity_like, me.Entity):
-                element["ontology_label"] = entity_like.ontology_label
-                element["unit"] = str(entity_like.unit)
-                element["description"] = entity_like.description
+                element = {
+                    "ontology_label": entity_like.ontology_label,
+                    "unit": str(entity_like.unit),
+                    "description": entity_like.description,
+                }
             elif isinstance(entity_like, u.Quantity):
-                element["unit"] = str(entity_like.unit)
+                element = {"unit": str(entity_like.unit)}
+            else:
+                element = {}
             result[name] = element
 
         return result
@@ -347,10 +387,11 @@ class EntityCollection:
                 description are used.
             description: Description of the entity collection.
         """
-        metadata = copy.deepcopy(metadata)  # do not modify the user's metadata dict
-        if missing_keys := set(dataframe.columns) - set(metadata):
+        columns = set(dataframe.columns)
+        metadata_keys = set(metadata)
+        if missing_keys := columns - metadata_keys:
             raise ValueError(f"Entity_Metadata is missing for columns: {', '.join(missing_keys)}")
-        if missing_keys := set(metadata) - set(dataframe.columns):
+        if missing_keys := metadata_keys - columns:
             raise ValueError(f"Entity_Metadata is missing for columns: {', '.join(missing_keys)}")
 
         collection = cls(description=description)
@@ -496,21 +537,22 @@ class EntityCollection:
         # convert data first because that will catch incompatible shape
         dataframe = self.to_dataframe()
 
-        # Header rows written in CSV format.
-        metadata_rows = [
-            [getattr(elem, "ontology_label", "") for _, elem in self],
-            [getattr(elem, "description", "") for _, elem in self],
-            [getattr(elem, "ontology_iri", "") for _, elem in self],
-            [str(getattr(elem, "unit", "")) for _, elem in self],
-        ]
+        # Header rows written in CSV format, collected in a single pass: ontology
+        # labels, descriptions, IRIs and units.
+        metadata_rows = [[], [], [], []]
+        for _, elem in self:
+            metadata_rows[0].append(getattr(elem, "ontology_label", ""))
+            metadata_rows[1].append(getattr(elem, "description", ""))
+            metadata_rows[2].append(getattr(elem, "ontology_iri", ""))
+            metadata_rows[3].append(str(getattr(elem, "unit", "")))
 
         with open(filename, "w", newline="") as csvfile:
-            csvfile.write(f"# mammos csv v3{os.linesep}")
+            header_lines = ["# mammos csv v3"]
             if self.description:
-                csvfile.write("#" + "-" * 40 + os.linesep)
-                for line in self.description.splitlines():
-                    csvfile.write(f"# {line}{os.linesep}")
-                csvfile.write("#" + "-" * 40 + os.linesep)
+                header_lines.append("#" + "-" * 40)
+                header_lines.extend(f"# {line}" for line in self.description.splitlines())
+                header_lines.append("#" + "-" * 40)
+            csvfile.write(os.linesep.join(header_lines) + os.linesep)
 
             writer = csv.writer(
                 csvfile,
@@ -744,7 +786,7 @@ class EntityCollection:
         entity_dict = {"metadata": None, **_serialize_collection(self)}
 
         # custom dumper to change style of lists, tuples and multi-line strings
-        class _Dumper(yaml.SafeDumper):
+        class _Dumper(_YAML_DUMPER):
             pass
 
         def _represent_sequence(dumper, value):
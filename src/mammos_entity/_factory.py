@@ -9,12 +9,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    import numpy.typing
-
 from mammos_entity._entity import Entity
 
 if TYPE_CHECKING:
+    import numpy.typing
+
     import mammos_entity
 
 
@@ -163,10 +162,10 @@ def Js(
             :py:class:`~mammos_entity.Entity`.
 
     Returns:
-        Entity :entity:`SpontaneousMagneticPolarisation`.
+        Entity :entity:`SpontaneousMagneticPolarization`.
 
     """
-    return Entity("SpontaneousMagneticPolarisation", value, unit, **kwargs)
+    return Entity("SpontaneousMagneticPolarization", value, unit, **kwargs)
 
 
 def K1(
@@ -2,16 +2,23 @@
 
 Loads and provides access to the MaMMoS magnetic materials ontology, including
 everything from the EMMO ontology, via the `EMMOntoPy` library. The ontology is loaded
-from ``.ttl`` (Turtle) files distributed with mammos-entity.
+from ``.ttl`` (Turtle) files distributed with mammos-entity. Loading the ontology is
+slow, therefore it is only loaded when ``mammos_ontology`` is accessed the first time.
 """
 
+import threading
+from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import ontopy
 
 logger = getLogger(__name__)
 
+if TYPE_CHECKING:
+    mammos_ontology: ontopy.ontology.Ontology
+
 
 def load_offline_ontology() -> ontopy.ontology.Ontology:
     """Load EMMO and MaMMoS ontology from 'ontology' directory.
@@ -46,7 +53,34 @@ def load_online_ontology() -> ontopy.ontology.Ontology:
     ).load()
 
 
-mammos_ontology = load_offline_ontology()
+_mammos_ontology: ontopy.ontology.Ontology | None = None
+_mammos_ontology_lock = threading.Lock()
+
+
+def _get_mammos_ontology() -> ontopy.ontology.Ontology:
+    """Return the offline ontology, loading it on the first call.
+
+    The first load is guarded by a lock so that concurrent first accesses from
+    multiple threads all get the same ontology object.
+    """
+    global _mammos_ontology
+    if _mammos_ontology is None:
+        with _mammos_ontology_lock:
+            if _mammos_ontology is None:
+                _mammos_ontology = load_offline_ontology()
+    return _mammos_ontology
+
+
+def __getattr__(name: str) -> ontopy.ontology.Ontology:
+    # Load ``mammos_ontology`` lazily on first access (PEP 562).
+    if name == "mammos_ontology":
+        return _get_mammos_ontology()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    # list the lazily loaded ``mammos_ontology`` for tab completion
+    return sorted([*globals(), "mammos_ontology"])
 
 
 def search_labels(text: str, auto_wildcard: bool = True) -> list[str]:
@@ -84,9 +118,17 @@ def search_labels(text: str, auto_wildcard: bool = True) -> list[str]:
         ['Magnetization']
 
     """  # noqa:E501
+    # return a new list, the cached result must not be modified
+    return list(_search_labels(text, auto_wildcard))
+
+
+@lru_cache(maxsize=1024)
+def _search_labels(text: str, auto_wildcard: bool) -> tuple[str, ...]:
+    """Search entity labels by name, see :py:func:`search_labels`."""
     label = f"*{text}*" if auto_wildcard else text
+    mammos_ontology = _get_mammos_ontology()
     match_by_label = set(mammos_ontology.search(label=label))
     match_by_prefLabel = set(mammos_ontology.search(prefLabel=label))
     match_by_altLabel = set(mammos_ontology.search(altLabel=label))
     possible_things = match_by_label | match_by_prefLabel | match_by_altLabel
-    return sorted(str(thing.prefLabel[0]) for thing in possible_things if hasattr(thing, "prefLabel"))
+    return tuple(sorted(str(thing.prefLabel[0]) for thing in possible_things if hasattr(thing, "prefLabel")))
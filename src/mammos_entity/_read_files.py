@@ -20,6 +20,12 @@ if TYPE_CHECKING:
 
     import mammos_entity
 
+# use the libyaml-based loader if PyYAML has been built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_CSV_VERSION_RE = re.compile(r"v\d+")
+_SUPPORTED_CSV_VERSIONS = ("v1", "v2", "v3")
+
 
 def from_csv(filename: str | os.PathLike) -> mammos_entity.EntityCollection:
     """Read MaMMoS CSV file.
@@ -38,14 +44,14 @@ def from_csv(filename: str | os.PathLike) -> mammos_entity.EntityCollection:
     """
     with open(filename, newline="") as csvfile:
         file_version_information = csvfile.readline()
-        version = re.search(r"v\d+", file_version_information)
+        version = _CSV_VERSION_RE.search(file_version_information)
         if version is None:
             raise RuntimeError(
                 f"Cannot read version information from file {filename}. "
                 f"Content of the first line: '{file_version_information}'"
             )
 
-        if version.group() not in [f"v{i}" for i in range(1, 4)]:
+        if version.group() not in _SUPPORTED_CSV_VERSIONS:
             raise RuntimeError(f"Reading mammos csv {version.group()} is not supported.")
         version_number = int(version.group().lstrip("v"))
 
@@ -140,17 +146,16 @@ def from_yaml(filename: str | os.PathLike) -> mammos_entity.EntityCollection:
 
     """
     with open(filename) as f:
-        first_line = f.readline().strip()
-    if first_line == "# mammos yaml v2":
-        return _from_yaml_v2(filename)
-    return _from_yaml_v1(filename)
-
+        text = f.read()
+    # the version comment is the first line, the parser ignores it
+    file_content = yaml.load(text, Loader=_YAML_LOADER)
+    if text.partition("\n")[0].strip() == "# mammos yaml v2":
+        return _from_yaml_v2(file_content)
+    return _from_yaml_v1(file_content)
 
-def _from_yaml_v1(filename: str | os.PathLike) -> mammos_entity.EntityCollection:
-    """Read MaMMoS YAML file v1."""
-    with open(filename) as f:
-        file_content = yaml.safe_load(f)
 
+def _from_yaml_v1(file_content: object) -> mammos_entity.EntityCollection:
+    """Create collection from the parsed content of a MaMMoS YAML file v1."""
     if not isinstance(file_content, Mapping):
         raise RuntimeError("mammos yaml v1 files must contain a top-level mapping.")
 
@@ -176,11 +181,8 @@ def _from_yaml_v1(filename: str | os.PathLike) -> mammos_entity.EntityCollection
     return collection
 
 
-def _from_yaml_v2(filename: str | os.PathLike) -> mammos_entity.EntityCollection:
-    """Read MaMMoS YAML file v2."""
-    with open(filename) as f:
-        file_content = yaml.safe_load(f)
-
+def _from_yaml_v2(file_content: object) -> mammos_entity.EntityCollection:
+    """Create collection from the parsed content of a MaMMoS YAML file v2."""
     if not isinstance(file_content, Mapping):
         raise RuntimeError("mammos yaml v2 files must contain a top-level mapping.")
 
@@ -384,6 +386,7 @@ def from_hdf5(
             value=element[()],
             unit=element.attrs["unit"],
             description=element.attrs["description"],
+            copy=False,
         )
     elif "unit" in element.attrs:
         return u.Quantity(element[()], element.attrs["unit"])
@@ -68,14 +68,17 @@ def concat_flat(
     elif len(set(ontology_labels)) > 1:
         raise ValueError("Entities with different ontology labels are not supported.")
     unit = u.Unit(unit) if unit is not None else first_unit
+    # collect flat magnitudes in the target unit; to_value does not copy if no
+    # conversion is required and ravel only copies non-contiguous arrays, so
+    # np.concatenate is the only full copy of the data
     values = []
     for e in _elements:
         if isinstance(e, Entity):
-            values.append(e.q.flatten().to(unit))
+            values.append(np.ravel(e.q.to_value(unit)))
         elif isinstance(e, u.Quantity):
-            values.append(e.flatten().to(unit))
+            values.append(np.ravel(e.to_value(unit)))
         else:
-            values.append(np.asarray(e).flatten() * unit)
+            values.append(np.ravel(e))
     if description is None:
         if len(_descriptions) > 1:
             warnings.warn(
@@ -85,4 +88,4 @@ def concat_flat(
                 stacklevel=1,
             )
         description = "|".join(_descriptions)
-    return Entity(ontology_labels[0], np.concatenate(values), unit, description=description)
+    return Entity(ontology_labels[0], np.concatenate(values), unit, description=description, copy=False)
@@ -1,4 +1,7 @@
+import inspect
 import math
+import pickle
+import weakref
 
 import astropy
 import mammos_units as u
@@ -83,6 +86,26 @@ def test_init_quantity():
     assert e.unit == u.MA / u.m
 
 
+def test_init_temperature_conversion():
+    """Initialize temperatures from quantities in degree Celsius.
+
+    The conversion requires the temperature equivalencies, both for a single quantity
+    and for a list of quantities.
+    """
+    e = me.T(0 * u.deg_C, "K")
+    assert e.unit == u.K
+    assert np.allclose(e.value, 273.15)
+    e = me.T([0 * u.deg_C, 1 * u.K])
+    assert e.unit == u.K
+    assert np.allclose(e.value, [273.15, 1])
+
+
+def test_init_temperature_conversion_string():
+    """Initialize temperatures from strings in degree Celsius."""
+    assert me.T("0 deg_C") == me.T(273.15)
+    assert me.T("0 deg_C", "K") == me.T(273.15)
+
+
 def test_init_entity():
     """Initialize from another Entity.
 
@@ -106,6 +129,49 @@ def test_init_entity():
         me.Entity("CurieTemperature", value=e_1)
 
 
+def test_init_copy():
+    """Initialize with and without copying the data."""
+    val = np.array([1.0, 2.0, 3.0])
+    assert not np.shares_memory(me.Ms(val).value, val)
+    assert np.shares_memory(me.Ms(val, copy=False).value, val)
+
+    q = val * u.A / u.m
+    assert not np.shares_memory(me.Ms(q).value, q)
+    assert not np.shares_memory(me.Ms(q, "A/m").value, q)
+    assert np.shares_memory(me.Ms(q, copy=False).value, q)
+    assert np.shares_memory(me.Ms(q, "A/m", copy=False).value, q)
+
+    # data is converted if required
+    e = me.Ms(q, "kA/m", copy=False)
+    assert not np.shares_memory(e.value, q)
+    assert np.allclose(e.value, [1e-3, 2e-3, 3e-3])
+
+    e_1 = me.Ms(val)
+    assert not np.shares_memory(me.Ms(e_1).value, e_1.value)
+    assert np.shares_memory(me.Ms(e_1, copy=False).value, e_1.value)
+
+
+def test_weakref():
+    e = me.Ms(1)
+    ref = weakref.ref(e)
+    assert ref() is e
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    e = me.Ms([1, 2], "kA/m", description="descr")
+    e_new = pickle.loads(pickle.dumps(e, protocol=protocol))
+    assert e_new == e
+    assert e_new.unit == e.unit
+    assert e_new.description == "descr"
+
+
+def test_no_arbitrary_attributes():
+    e = me.Ms(1)
+    with pytest.raises(AttributeError):
+        e.foo = 1
+
+
 def test_unitless():
     """Test unitless Entity."""
     e_1 = me.Entity("DemagnetizingFactor", 0.3)
@@ -151,6 +217,20 @@ def test_check_units():
         me.Entity("SpontaneousMagnetization", value=1 * u.T, unit="A/m")
 
 
+def test_unit_string_enabled_units():
+    """Unit strings are parsed with the units enabled when creating the entity."""
+    kiloampere_per_m = u.def_unit("mammos_test_kA_per_m", 1e3 * u.A / u.m)
+    with u.add_enabled_units([kiloampere_per_m]):
+        e = me.Ms(1, "mammos_test_kA_per_m")
+        assert e.unit == kiloampere_per_m
+    with pytest.raises(ValueError):
+        me.Ms(1, "mammos_test_kA_per_m")
+    with u.set_enabled_aliases({"mammos_test_A_per_m": u.A / u.m}):
+        assert me.Ms(1, "mammos_test_A_per_m").unit == u.A / u.m
+    with pytest.raises(ValueError):
+        me.Ms(1, "mammos_test_A_per_m")
+
+
 def test_repr():
     """Test representation string.
 
@@ -248,6 +328,29 @@ def test_default_unit():
     assert me.Entity("SpontaneousMagneticPolarisation").unit == u.T
 
 
+@pytest.mark.parametrize("label", me._entity._BUILTIN_ONTOLOGY_UNITS)
+def test_builtin_ontology_units(label):
+    """Test that the built-in units of the factory entities match the ontology."""
+    pref_label_matches = me.mammos_ontology.search(prefLabel=label)
+    assert len(pref_label_matches) == 1
+    assert str(pref_label_matches[0].prefLabel[0]) == label
+    assert me._entity._get_all_possible_units(label) == me._entity._find_all_possible_units(label)
+    assert me._entity._BUILTIN_ONTOLOGY_IRIS[label] == pref_label_matches[0].iri
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [f for _, f in inspect.getmembers(me._factory, inspect.isfunction) if f.__module__ == me._factory.__name__],
+)
+def test_builtin_ontology_units_factory(factory):
+    """All factory entities are in the built-in table and do not need the ontology."""
+    assert factory().ontology_label in me._entity._BUILTIN_ONTOLOGY_UNITS
+
+
+def test_builtin_ontology_iris_labels():
+    assert me._entity._BUILTIN_ONTOLOGY_IRIS.keys() == me._entity._BUILTIN_ONTOLOGY_UNITS.keys()
+
+
 def test_label_without_concrete_units():
     """Test the ontology entries without concrete units.
 
@@ -329,6 +432,8 @@ def test_equality():
     assert e_1 != e_6
     e_7 = me.Entity("SpontaneousMagnetization", value=[[1], [1]])
     assert e_6 != e_7
+    assert e_1 == e_1
+    assert me.T(0, "deg_C") == me.T(273.15, "K")
 
     # Other objects
     assert e_1 != 1 * u.A / u.m
@@ -344,6 +449,38 @@ def test_equality():
     assert e_1 == A()
 
 
+@pytest.mark.parametrize(
+    "value_1, value_2",
+    (
+        (1, 1 + 1e-6),
+        (1e-20, 1.000001e-20),
+        (np.nan, np.nan),
+        (np.inf, np.inf),
+        (-np.inf, -np.inf),
+        (0, 1e-300),
+        (1, 1.1),
+        (1, np.nan),
+        (np.inf, -np.inf),
+        (1e300, np.inf),
+    ),
+)
+def test_equality_scalar(value_1, value_2):
+    """Test that scalar equality agrees with u.allclose for the same unit."""
+    expected = u.allclose(value_1 * u.A / u.m, value_2 * u.A / u.m, equal_nan=True)
+    assert (me.Ms(value_1) == me.Ms(value_2)) == expected
+    assert (me.Ms(value_2) == me.Ms(value_1)) == u.allclose(value_2 * u.A / u.m, value_1 * u.A / u.m, equal_nan=True)
+
+
+def test_equality_array():
+    """Test equality of array entities with the same unit."""
+    values = np.array([0, 1, np.nan, np.inf, 1e-20])
+    assert me.Ms(values) == me.Ms(values * (1 + 1e-6))
+    assert me.Ms(values) != me.Ms(values * (1 + 1e-4))
+    assert me.Ms(values) != me.Ms(values[:-1])
+    assert me.Ms(values) != me.Ms(values.reshape(1, -1))
+    assert me.Ms(values, "kA/m") == me.Ms(values * 1e3, "A/m")
+
+
 @pytest.mark.parametrize(
     "function, expected_label",
     (
@@ -1,3 +1,7 @@
+import copy
+import pickle
+import weakref
+
 import mammos_units as u
 import pandas as pd
 import pytest
@@ -198,6 +202,55 @@ def test_dataframe_roundtrip():
     ]
 
 
+def test_deepcopy():
+    sub = me.EntityCollection(Ms=me.Ms([1, 2]))
+    ec = me.EntityCollection("descr", a=sub, b=sub, n=1, s="text", l=[1, 2])
+    ec["self"] = ec
+    ec_copy = copy.deepcopy(ec)
+    assert ec_copy.description == "descr"
+    assert ec_copy["self"] is ec_copy
+    assert ec_copy.a is ec_copy.b
+    assert ec_copy.a is not sub
+    assert ec_copy.a.Ms == sub.Ms
+    assert ec_copy.a.Ms is not sub.Ms
+    assert ec_copy.l == [1, 2]
+    assert ec_copy.l is not ec.l
+    assert (ec_copy.n, ec_copy.s) == (1, "text")
+
+
+def test_private_names_not_accessible_as_attributes():
+    ec = me.EntityCollection()
+    ec["_private"] = me.Ms()
+    assert ec["_private"] == me.Ms()
+    assert not hasattr(ec, "_private")
+    assert not hasattr(ec, "__array__")
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    ec = me.EntityCollection("descr", Ms=me.Ms([1, 2]), x=[3, 4], sub=me.EntityCollection(T=me.T(1)))
+    ec["_private"] = 5
+    ec_new = pickle.loads(pickle.dumps(ec, protocol=protocol))
+    assert ec_new.description == "descr"
+    assert [name for name, _entity in ec_new] == ["Ms", "x", "sub", "_private"]
+    assert ec_new.Ms == ec.Ms
+    assert ec_new.x == [3, 4]
+    assert me.T(1) == ec_new.sub.T
+    assert ec_new["_private"] == 5
+
+    # methods overwritten on the instance are preserved
+    ec.to_dataframe = "missing"
+    ec_new = pickle.loads(pickle.dumps(ec, protocol=protocol))
+    assert ec_new.to_dataframe == "missing"
+    assert "to_dataframe" not in ec_new
+
+
+def test_weakref():
+    ec = me.EntityCollection(a=1)
+    ref = weakref.ref(ec)
+    assert ref() is ec
+
+
 def test_ipython_key_completions_():
     col = me.EntityCollection()
     assert col._ipython_key_completions_() == []
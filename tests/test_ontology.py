@@ -1,3 +1,9 @@
+import subprocess
+import sys
+
+import ontopy
+
+import mammos_entity as me
 from mammos_entity import search_labels
 
 
@@ -31,6 +37,13 @@ def test_search_labels_whole_match():
     assert search_labels("*Polarization*", auto_wildcard=False) == search_labels("*Polarization*")
 
 
+def test_search_labels_returns_new_list():
+    """Modifying the returned list does not affect later searches."""
+    res = search_labels("SpontaneousMagnetization")
+    res.append("Modified")
+    assert search_labels("SpontaneousMagnetization") == ["SpontaneousMagnetization"]
+
+
 def test_problematic_labels():
     """Test problematic labels.
 
@@ -52,3 +65,32 @@ def test_empty_label():
     assert "ExchangeStiffnessConstant" in all_labels
     assert "MaximumEnergyProduct" in all_labels
     assert "CurieTemperature" in all_labels
+
+
+def test_lazy_ontology():
+    """The ontology is only loaded when it is accessed the first time.
+
+    Creating entities with the factory functions does not require the ontology.
+    """
+    code = (
+        "import mammos_entity as me; me.Ms(1, 'kA/m'); me.T().ontology_iri; "
+        "print(me._ontology._mammos_ontology is None)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "True"
+    assert isinstance(me.mammos_ontology, ontopy.ontology.Ontology)
+    assert me.mammos_ontology is me._ontology.mammos_ontology
+    assert "mammos_ontology" in dir(me)
+    assert "mammos_ontology" in dir(me._ontology)
+
+
+def test_lazy_ontology_threads():
+    """Concurrent first accesses from several threads load the ontology only once."""
+    code = (
+        "from concurrent.futures import ThreadPoolExecutor; import mammos_entity as me; "
+        "ex = ThreadPoolExecutor(4); "
+        "res = list(ex.map(lambda _: me.mammos_ontology, range(4))); "
+        "print(len({id(o) for o in res}))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "1"
@@ -194,6 +194,45 @@ def test_read_yaml_v2_nested(tmp_path):
     assert read_data.T.description == "measurement conditions"
 
 
+def test_write_read_yaml_long_quoted_description(tmp_path):
+    """Multi-line strings with trailing spaces are written as quoted scalars."""
+    description = "Trailing spaces   \n" + "word " * 30 + "\nlast"
+    collection = me.EntityCollection(description, Ms=me.Ms(1, description=description))
+    collection.to_yaml(tmp_path / "example.yaml")
+
+    read_data = me.from_yaml(tmp_path / "example.yaml")
+    assert read_data.description == description
+    assert read_data.Ms.description == description
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML without libyaml folds quoted scalars differently")
+def test_write_yaml_long_quoted_description_format(tmp_path):
+    """Long quoted scalars are folded at spaces by the libyaml emitter."""
+    description = "Trailing spaces   \n" + "word " * 30 + "\nlast"
+    collection = me.EntityCollection(description, Ms=me.Ms(1, description=description))
+    collection.to_yaml(tmp_path / "example.yaml")
+
+    expected = textwrap.dedent(
+        """\
+        # mammos yaml v2
+        metadata: null
+        description: "Trailing spaces   \\nword word word word word word word word word word
+          word word word word word word word word word word word word word word word word
+          word word word word \\nlast"
+        data:
+          Ms:
+            ontology_label: SpontaneousMagnetization
+            description: "Trailing spaces   \\nword word word word word word word word word
+              word word word word word word word word word word word word word word word word
+              word word word word word \\nlast"
+            ontology_iri: https://w3id.org/emmo/domain/magnetic-materials#EMMO_032731f8-874d-5efb-9c9d-6dafaa17ef25
+            unit: A / m
+            value: 1.0
+        """
+    )
+    assert (tmp_path / "example.yaml").read_text() == expected
+
+
 def test_write_yaml_key_types(tmp_path):
     sample = me.EntityCollection(
         description="Sample 1",